@@ -0,0 +1,181 @@
+# cython: language_level=3
+# distutils: language = c++
+# distutils: libraries = hs
+"""Native contact scanner: one hs_scan per page, spans collected in C."""
+
+import re
+
+from libcpp.algorithm cimport sort
+from libcpp.vector cimport vector
+
+
+cdef extern from "hs/hs.h" nogil:
+    ctypedef int hs_error_t
+    ctypedef struct hs_database_t:
+        pass
+    ctypedef struct hs_scratch_t:
+        pass
+    ctypedef struct hs_platform_info_t:
+        pass
+    ctypedef struct hs_compile_error_t:
+        char *message
+        int expression
+    ctypedef int (*match_event_handler)(
+        unsigned int id,
+        unsigned long long start,
+        unsigned long long end,
+        unsigned int flags,
+        void *context,
+    ) noexcept nogil
+
+    int HS_SUCCESS
+    int HS_MODE_BLOCK
+    int HS_FLAG_CASELESS
+    int HS_FLAG_SOM_LEFTMOST
+
+    hs_error_t hs_compile_multi(
+        const char *const *expressions,
+        const unsigned int *flags,
+        const unsigned int *ids,
+        unsigned int elements,
+        unsigned int mode,
+        const hs_platform_info_t *platform,
+        hs_database_t **db,
+        hs_compile_error_t **error,
+    )
+    hs_error_t hs_free_compile_error(hs_compile_error_t *error)
+    hs_error_t hs_free_database(hs_database_t *db)
+    hs_error_t hs_alloc_scratch(const hs_database_t *db, hs_scratch_t **scratch)
+    hs_error_t hs_free_scratch(hs_scratch_t *scratch)
+    hs_error_t hs_scan(
+        const hs_database_t *db,
+        const char *data,
+        unsigned int length,
+        unsigned int flags,
+        hs_scratch_t *scratch,
+        match_event_handler on_event,
+        void *context,
+    )
+
+
+cdef enum:
+    EMAIL_ID = 0
+    PHONE_ID = 1
+    OBFUSCATED_ID = 2
+
+
+cdef struct Span:
+    unsigned int id
+    unsigned long long start
+    unsigned long long end
+
+
+cdef bint _span_less(const Span &left, const Span &right) noexcept nogil:
+    if left.id != right.id:
+        return left.id < right.id
+    return left.start < right.start
+
+
+cdef int _on_match(
+    unsigned int id,
+    unsigned long long start,
+    unsigned long long end,
+    unsigned int flags,
+    void *context,
+) noexcept nogil:
+    (<vector[Span] *> context).push_back(Span(id, start, end))
+    return 0
+
+
+cdef class Scanner:
+    """Compiled email/phone/obfuscated-email database with its own scratch.
+
+    Takes the three patterns compiled from byte strings; Hyperscan finds
+    candidate regions and the patterns confirm them with findall. A Scanner
+    is not thread-safe; keep one per thread.
+    """
+
+    cdef hs_database_t *_database
+    cdef hs_scratch_t *_scratch
+    cdef tuple _patterns
+
+    def __cinit__(self, object email_re, object phone_re, object obfuscated_re):
+        cdef tuple patterns = (email_re, phone_re, obfuscated_re)
+        cdef const char *expressions[3]
+        cdef unsigned int flags[3]
+        cdef unsigned int ids[3]
+        cdef hs_compile_error_t *error = NULL
+        cdef unsigned int index
+
+        for index in range(3):
+            expressions[index] = patterns[index].pattern
+            flags[index] = HS_FLAG_SOM_LEFTMOST
+            if patterns[index].flags & re.IGNORECASE:
+                flags[index] |= HS_FLAG_CASELESS
+            ids[index] = index
+
+        if hs_compile_multi(
+            expressions, flags, ids, 3, HS_MODE_BLOCK, NULL, &self._database, &error
+        ) != HS_SUCCESS:
+            message = error.message.decode() if error != NULL else "unknown error"
+            hs_free_compile_error(error)
+            raise ValueError(f"hyperscan compile failed: {message}")
+        if hs_alloc_scratch(self._database, &self._scratch) != HS_SUCCESS:
+            raise MemoryError("hyperscan scratch allocation failed")
+        self._patterns = patterns
+
+    def __dealloc__(self):
+        if self._scratch != NULL:
+            hs_free_scratch(self._scratch)
+        if self._database != NULL:
+            hs_free_database(self._database)
+
+    def extract(self, bytes data):
+        """Return ``(emails, phones)`` sets found in UTF-8 encoded ``data``."""
+        cdef vector[Span] spans
+        cdef const char *buffer = data
+        cdef unsigned int length = len(data)
+        cdef hs_error_t status
+        cdef size_t index = 0
+        cdef size_t count
+        cdef unsigned int region_id
+        cdef unsigned long long region_start
+        cdef unsigned long long region_end
+        cdef set emails = set()
+        cdef set phones = set()
+
+        with nogil:
+            status = hs_scan(
+                self._database, buffer, length, 0, self._scratch, _on_match, &spans
+            )
+        if status != HS_SUCCESS:
+            raise RuntimeError(f"hyperscan scan failed with status {status}")
+
+        # Every regex match lies inside some reported span, so findall over
+        # the merged regions gives exactly what findall over the whole text
+        # would.
+        sort(spans.begin(), spans.end(), _span_less)
+        count = spans.size()
+        while index < count:
+            region_id = spans[index].id
+            region_start = spans[index].start
+            region_end = spans[index].end
+            index += 1
+            while (
+                index < count
+                and spans[index].id == region_id
+                and spans[index].start <= region_end
+            ):
+                if spans[index].end > region_end:
+                    region_end = spans[index].end
+                index += 1
+
+            matches = self._patterns[region_id].findall(data, region_start, region_end)
+            if region_id == EMAIL_ID:
+                emails.update(match.decode() for match in matches)
+            elif region_id == PHONE_ID:
+                phones.update(match.decode().strip() for match in matches)
+            else:
+                for user, domain, tld in matches:
+                    emails.add(f"{user.decode()}@{domain.decode()}.{tld.decode()}")
+        return emails, phones
@@ -5,29 +5,57 @@ import argparse
 from freelance_crawler.config import CrawlerConfig
 from freelance_crawler.crawler import run_crawl, write_csv
 
+_DEFAULTS = CrawlerConfig()
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Crawl member sites for contact details.")
     parser.add_argument(
         "--directory-url",
-        default=CrawlerConfig().directory_url,
+        default=_DEFAULTS.directory_url,
         help="Member directory page to start from.",
     )
     parser.add_argument(
         "--delay",
         type=float,
-        default=CrawlerConfig().delay_s,
-        help="Delay in seconds between requests.",
+        default=_DEFAULTS.delay_s,
+        help="Delay in seconds between requests to the same host.",
     )
     parser.add_argument(
         "--timeout",
         type=int,
-        default=CrawlerConfig().timeout_s,
+        default=_DEFAULTS.timeout_s,
         help="Timeout in seconds for each request.",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=_DEFAULTS.max_workers,
+        help="Number of sites to crawl concurrently.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=_DEFAULTS.cache_dir,
+        help="Directory for the on-disk HTTP cache.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every page from the network without the HTTP cache.",
+    )
     parser.add_argument(
         "--output",
-        default=CrawlerConfig().output_csv,
+        default=_DEFAULTS.output_csv,
         help="Output CSV path.",
     )
     return parser
@@ -41,6 +69,8 @@ def main() -> None:
         directory_url=args.directory_url,
         delay_s=args.delay,
         timeout_s=args.timeout,
+        max_workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
         output_csv=args.output,
     )
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -19,12 +21,22 @@ class CrawlerConfig:
     timeout_s: int = 15
     delay_s: float = 1.0
     max_contact_pages: int = 8
+    max_workers: int = 32
+    per_host_limit: int = 2
+    max_body_bytes: int = 2_000_000
+    dns_cache_ttl_s: int = 300
+    cache_dir: str | None = ".crawler_cache"
+    cache_expire_s: int = 86400
     output_csv: str = "sverigestidskrifter_contacts.csv"
 
-    @property
+    @cached_property
     def headers(self) -> dict[str, str]:
         return {"User-Agent": self.user_agent}
 
+    @cached_property
+    def hint_re(self) -> re.Pattern[str]:
+        return re.compile("|".join(map(re.escape, self.contact_hints)), re.IGNORECASE)
+
 
 @dataclass
 class CrawlResult:
@@ -1,37 +1,268 @@
 from __future__ import annotations
 
+import asyncio
 import csv
-import re
+import threading
 import time
-from dataclasses import asdict
-from typing import Callable, Iterable
-from urllib.parse import urljoin, urlparse
+import unicodedata
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+from urllib.parse import unquote, urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
 
 from freelance_crawler.config import CrawlResult, CrawlerConfig
 
-EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
-PHONE_RE = re.compile(r"(\+?\d[\d\s().\-]{6,}\d)")
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - BeautifulSoup fallback
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+try:
+    import regex as re
+except ImportError:  # pragma: no cover - stdlib fallback
+    import re
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional accelerator
+    hyperscan = None
+
+try:
+    from aiohttp_client_cache import CachedSession
+    from aiohttp_client_cache.backends.sqlite import SQLiteBackend
+except ImportError:  # pragma: no cover - optional HTTP cache
+    CachedSession = None
+
+try:
+    from freelance_crawler._extract import Scanner
+except ImportError:  # pragma: no cover - native extension not built
+    Scanner = None
+
+# ASCII-only classes match what Hyperscan compiles, so every backend gives
+# the same result; extract_contacts NFKC-normalizes text first so NBSP and
+# full-width digits still count.
+EMAIL_RE = re.compile(
+    r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", flags=re.ASCII
+)
+PHONE_RE = re.compile(r"(\+?\d[\d\s().\-]{6,30}\d)", flags=re.ASCII)
 OBFUSCATED_RE = re.compile(
     r"([a-zA-Z0-9._%+\-]+)\s*(?:\(|\[)?at(?:\)|\])?\s*"
     r"([a-zA-Z0-9.\-]+)\s*(?:\(|\[)?dot(?:\)|\])?\s*([a-zA-Z]{2,})",
-    flags=re.IGNORECASE,
+    flags=re.IGNORECASE | re.ASCII,
+)
+# Cheap C-level checks for text every pattern needs, so pages without it
+# skip the full regex pass.
+_DIGIT_RE = re.compile(r"[0-9]")
+_OBFUSCATED_HINT_RE = re.compile(r"dot", flags=re.IGNORECASE)
+
+_EMAIL_ID, _PHONE_ID, _OBFUSCATED_ID = range(3)
+# Byte-string twins of the patterns above, used to confirm Hyperscan spans.
+_BYTES_PATTERNS = tuple(
+    re.compile(pattern.pattern.encode(), pattern.flags & re.IGNORECASE)
+    for pattern in (EMAIL_RE, PHONE_RE, OBFUSCATED_RE)
 )
 
+FETCH_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 2
+_RETRY_BACKOFF_S = 0.3
+_HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+_READ_CHUNK_BYTES = 65536
+_NOISE_TAGS = ["script", "style", "noscript", "template"]
+
+_parse_url = lru_cache(maxsize=8192)(urlparse)
+
+_thread_local = threading.local()
+
+
+def _build_scan_database() -> hyperscan.Database | None:
+    if hyperscan is None or Scanner is not None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.pattern for pattern in _BYTES_PATTERNS],
+        ids=[_EMAIL_ID, _PHONE_ID, _OBFUSCATED_ID],
+        elements=3,
+        flags=[
+            hyperscan.HS_FLAG_SOM_LEFTMOST
+            | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0)
+            for pattern in _BYTES_PATTERNS
+        ],
+    )
+    return database
+
+
+_SCAN_DATABASE = _build_scan_database()
+
+
+def _cache_filter(config: CrawlerConfig) -> Callable[[aiohttp.ClientResponse], bool]:
+    # The cache reads and stores whole decompressed bodies before saving
+    # them, so only store uncompressed HTML whose declared size is within
+    # the cap read_html would read anyway; a compressed Content-Length says
+    # nothing about the decompressed size.
+    def is_cacheable(response: aiohttp.ClientResponse) -> bool:
+        return (
+            response.content_type in _HTML_CONTENT_TYPES
+            and response.headers.get("Content-Encoding", "identity").lower() == "identity"
+            and response.content_length is not None
+            and response.content_length <= config.max_body_bytes
+        )
+
+    return is_cacheable
+
+
+def create_session(
+    config: CrawlerConfig,
+    limiter: HostLimiter | None = None,
+) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=200,
+        limit_per_host=config.per_host_limit,
+        use_dns_cache=True,
+        ttl_dns_cache=config.dns_cache_ttl_s,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=None,
+        sock_connect=config.timeout_s,
+        sock_read=config.timeout_s,
+    )
+    trace_configs = [limiter.trace_config()] if limiter is not None else None
+    if config.cache_dir and CachedSession is not None:
+        cache = SQLiteBackend(
+            cache_name=str(Path(config.cache_dir) / "http_cache.sqlite"),
+            expire_after=config.cache_expire_s,
+            allowed_methods=("GET",),
+            cache_control=True,
+            filter_fn=_cache_filter(config),
+        )
+        return CachedSession(
+            cache=cache,
+            connector=connector,
+            headers=config.headers,
+            timeout=timeout,
+            trace_configs=trace_configs,
+        )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=config.headers,
+        timeout=timeout,
+        trace_configs=trace_configs,
+    )
+
+
+async def read_html(response: aiohttp.ClientResponse, config: CrawlerConfig) -> str:
+    if (
+        "Content-Type" in response.headers
+        and response.content_type not in _HTML_CONTENT_TYPES
+    ):
+        return ""
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_BYTES):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= config.max_body_bytes:
+            break
+    body = b"".join(chunks)[: config.max_body_bytes]
+    try:
+        return body.decode(response.charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class HostLimiter:
+    def __init__(self, interval_s: float) -> None:
+        self._interval_s = interval_s
+        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._last: dict[str, float] = defaultdict(float)
+
+    async def acquire(self, host: str) -> None:
+        async with self._locks[host]:
+            wait_s = self._interval_s - (time.monotonic() - self._last[host])
+            if wait_s > 0:
+                await asyncio.sleep(wait_s)
+            self._last[host] = time.monotonic()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        # Paces from the request-start hook, which cache hits never reach,
+        # so only requests that go to the network wait their turn.
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        return trace_config
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: object,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        await self.acquire(_parse_url(str(params.url)).netloc)
+
+
+async def fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    config: CrawlerConfig,
+) -> str:
+    attempt = 0
+    while True:
+        try:
+            async with session.get(url) as response:
+                if response.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    response.raise_for_status()
+                    return await read_html(response, config)
+        except aiohttp.ClientConnectionError:
+            if attempt == _MAX_RETRIES:
+                raise
+        attempt += 1
+        await asyncio.sleep(_RETRY_BACKOFF_S * 2 ** (attempt - 1))
+
+
+def parse_html(html: str) -> LexborHTMLParser | BeautifulSoup:
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, "lxml")
+
+
+def iter_hrefs(tree: LexborHTMLParser | BeautifulSoup) -> Iterator[str]:
+    if LexborHTMLParser is not None:
+        for node in tree.css("a[href]"):
+            yield node.attributes.get("href") or ""
+    else:
+        for anchor in tree.find_all("a", href=True):
+            yield anchor["href"]
 
-def fetch(url: str, config: CrawlerConfig) -> str:
-    response = requests.get(url, headers=config.headers, timeout=config.timeout_s)
-    response.raise_for_status()
-    return response.text
 
+def iter_anchors(tree: LexborHTMLParser | BeautifulSoup) -> Iterator[tuple[str, str]]:
+    if LexborHTMLParser is not None:
+        for node in tree.css("a[href]"):
+            yield node.attributes.get("href") or "", node.text()
+    else:
+        for anchor in tree.find_all("a", href=True):
+            yield anchor["href"], anchor.get_text()
 
-def extract_links(html: str, base_url: str) -> set[str]:
-    soup = BeautifulSoup(html, "html.parser")
+
+def page_text(tree: LexborHTMLParser | BeautifulSoup) -> str:
+    if LexborHTMLParser is not None:
+        tree.strip_tags(_NOISE_TAGS)
+        return (tree.body or tree.root).text(separator=" ", strip=True)
+    for tag in tree(_NOISE_TAGS):
+        tag.decompose()
+    return (tree.body or tree).get_text(" ", strip=True)
+
+
+def extract_links(tree: LexborHTMLParser | BeautifulSoup, base_url: str) -> set[str]:
     links: set[str] = set()
-    for anchor in soup.select("a[href]"):
-        href = anchor.get("href", "").strip()
+    for href in iter_hrefs(tree):
+        href = href.strip()
         if not href:
             continue
         if href.startswith("http://") or href.startswith("https://"):
@@ -42,110 +273,234 @@ def extract_links(html: str, base_url: str) -> set[str]:
 
 
 def normalize_site(url: str) -> str | None:
-    parsed = urlparse(url)
+    parsed = _parse_url(url)
     if not parsed.scheme or not parsed.netloc:
         return None
     return f"{parsed.scheme}://{parsed.netloc}/"
 
 
 def find_candidate_contact_pages(
-    html: str,
+    tree: LexborHTMLParser | BeautifulSoup,
     base_url: str,
     config: CrawlerConfig,
 ) -> list[str]:
-    soup = BeautifulSoup(html, "html.parser")
+    hint_re = config.hint_re
     candidates: list[str] = []
-    for anchor in soup.select("a[href]"):
-        href = anchor.get("href", "")
-        text = (anchor.get_text() or "").lower()
-        target = (href or "").lower()
-        if any(hint in text or hint in target for hint in config.contact_hints):
+    for href, text in iter_anchors(tree):
+        if hint_re.search(href) or hint_re.search(text):
             candidates.append(urljoin(base_url, href))
-    deduped: list[str] = []
-    seen = set()
-    for url in candidates:
-        if url not in seen:
-            seen.add(url)
-            deduped.append(url)
-    return deduped[: config.max_contact_pages]
+    return list(dict.fromkeys(candidates))[: config.max_contact_pages]
+
+
+def _merge_spans(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    # Every regex match lies inside some reported span, so findall over the
+    # merged regions gives exactly what findall over the whole text would.
+    regions: list[tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if regions and start <= regions[-1][1]:
+            if end > regions[-1][1]:
+                regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def _native_scanner() -> Scanner:
+    scanner = getattr(_thread_local, "scanner", None)
+    if scanner is None:
+        scanner = Scanner(*_BYTES_PATTERNS)
+        _thread_local.scanner = scanner
+    return scanner
+
+
+def _scan_contacts(text: str) -> tuple[set[str], set[str]]:
+    scratch = getattr(_thread_local, "scratch", None)
+    if scratch is None:
+        scratch = hyperscan.Scratch(_SCAN_DATABASE)
+        _thread_local.scratch = scratch
+
+    data = text.encode("utf-8")
+    spans: dict[int, list[tuple[int, int]]] = defaultdict(list)
 
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        spans[pattern_id].append((start, end))
 
-def extract_contacts(text: str) -> tuple[list[str], list[str]]:
-    emails = set(EMAIL_RE.findall(text))
-    phones = set(match.strip() for match in PHONE_RE.findall(text))
+    _SCAN_DATABASE.scan(data, match_event_handler=on_match, scratch=scratch)
 
-    for user, domain, tld in OBFUSCATED_RE.findall(text):
-        emails.add(f"{user}@{domain}.{tld}")
+    email_re, phone_re, obfuscated_re = _BYTES_PATTERNS
+    emails: set[str] = set()
+    phones: set[str] = set()
+    for start, end in _merge_spans(spans[_EMAIL_ID]):
+        emails.update(match.decode() for match in email_re.findall(data, start, end))
+    for start, end in _merge_spans(spans[_PHONE_ID]):
+        phones.update(
+            match.decode().strip() for match in phone_re.findall(data, start, end)
+        )
+    for start, end in _merge_spans(spans[_OBFUSCATED_ID]):
+        for user, domain, tld in obfuscated_re.findall(data, start, end):
+            emails.add(f"{user.decode()}@{domain.decode()}.{tld.decode()}")
+    return emails, phones
 
-    return sorted(emails), sorted(phones)
 
+def _regex_contacts(text: str) -> tuple[set[str], set[str]]:
+    emails = set(EMAIL_RE.findall(text)) if "@" in text else set()
+    phones: set[str] = set()
+    if _DIGIT_RE.search(text):
+        phones.update(match.strip() for match in PHONE_RE.findall(text))
 
-def crawl_site(site: str, config: CrawlerConfig) -> CrawlResult:
-    html = fetch(site, config)
-    emails, phones = extract_contacts(html)
-    contact_pages = find_candidate_contact_pages(html, site, config)
+    if _OBFUSCATED_HINT_RE.search(text):
+        for user, domain, tld in OBFUSCATED_RE.findall(text):
+            emails.add(f"{user}@{domain}.{tld}")
+
+    return emails, phones
+
+
+def extract_contacts(text: str) -> tuple[set[str], set[str]]:
+    text = unicodedata.normalize("NFKC", text)
+    if Scanner is not None:
+        return _native_scanner().extract(text.encode("utf-8"))
+    if _SCAN_DATABASE is not None:
+        return _scan_contacts(text)
+    return _regex_contacts(text)
+
+
+def extract_link_contacts(
+    tree: LexborHTMLParser | BeautifulSoup,
+) -> tuple[set[str], set[str]]:
+    emails: set[str] = set()
+    phones: set[str] = set()
+    for href in iter_hrefs(tree):
+        scheme, _, value = href.strip().partition(":")
+        scheme = scheme.lower()
+        if scheme == "mailto":
+            for address in unquote(value.split("?", 1)[0]).split(","):
+                address = address.strip()
+                if EMAIL_RE.fullmatch(address):
+                    emails.add(address)
+        elif scheme == "tel":
+            number = unquote(value).strip()
+            if number:
+                phones.add(number)
+    return emails, phones
+
+
+def extract_page_contacts(
+    tree: LexborHTMLParser | BeautifulSoup,
+) -> tuple[set[str], set[str]]:
+    emails, phones = extract_link_contacts(tree)
+    text_emails, text_phones = extract_contacts(page_text(tree))
+    return emails | text_emails, phones | text_phones
+
+
+async def crawl_site(
+    session: aiohttp.ClientSession,
+    site: str,
+    config: CrawlerConfig,
+) -> CrawlResult:
+    tree = parse_html(await fetch(session, site, config))
+    # page_text strips noscript/template in place, so collect links first.
+    contact_pages = find_candidate_contact_pages(tree, site, config)
+    emails, phones = extract_page_contacts(tree)
 
     for contact_page in contact_pages:
-        time.sleep(config.delay_s)
         try:
-            contact_html = fetch(contact_page, config)
-        except requests.RequestException:
+            contact_tree = parse_html(await fetch(session, contact_page, config))
+        except FETCH_ERRORS:
             continue
-        more_emails, more_phones = extract_contacts(contact_html)
-        emails = sorted(set(emails) | set(more_emails))
-        phones = sorted(set(phones) | set(more_phones))
+        more_emails, more_phones = extract_page_contacts(contact_tree)
+        emails.update(more_emails)
+        phones.update(more_phones)
 
     return CrawlResult(
         site=site,
-        emails=emails,
-        phones=phones,
+        emails=sorted(emails),
+        phones=sorted(phones),
         contact_pages_checked=contact_pages,
     )
 
 
-def collect_sites(directory_url: str, config: CrawlerConfig) -> list[str]:
-    directory_html = fetch(directory_url, config)
-    member_links = extract_links(directory_html, directory_url)
-    sites = sorted({normalize_site(link) for link in member_links if normalize_site(link)})
-    return [site for site in sites if site is not None]
+async def collect_sites(
+    session: aiohttp.ClientSession,
+    directory_url: str,
+    config: CrawlerConfig,
+) -> list[str]:
+    directory_tree = parse_html(await fetch(session, directory_url, config))
+    member_links = extract_links(directory_tree, directory_url)
+    return sorted({site for site in map(normalize_site, member_links) if site})
+
+
+async def crawl_all(
+    config: CrawlerConfig,
+    progress_callback: Callable[[int, int, CrawlResult], None] | None = None,
+) -> list[CrawlResult]:
+    if config.max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {config.max_workers}")
+    limiter = HostLimiter(config.delay_s)
+    async with create_session(config, limiter) as session:
+        sites = await collect_sites(session, config.directory_url, config)
+        site_slots = asyncio.Semaphore(config.max_workers)
+        host_slots: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(config.per_host_limit),
+        )
+        completed = 0
+
+        async def crawl_one(site: str) -> CrawlResult:
+            nonlocal completed
+            async with host_slots[_parse_url(site).netloc], site_slots:
+                try:
+                    result = await crawl_site(session, site, config)
+                except FETCH_ERRORS as exc:
+                    result = CrawlResult(site=site, error=str(exc) or type(exc).__name__)
+            completed += 1
+            if result.error:
+                print(f"[{completed}/{len(sites)}] {site} -> ERROR: {result.error}")
+            else:
+                print(
+                    f"[{completed}/{len(sites)}] {site} -> {len(result.emails)} emails, "
+                    f"{len(result.phones)} phones",
+                )
+            if progress_callback:
+                progress_callback(completed, len(sites), result)
+            return result
+
+        return list(await asyncio.gather(*(crawl_one(site) for site in sites)))
 
 
 def run_crawl(
     config: CrawlerConfig,
     progress_callback: Callable[[int, int, CrawlResult], None] | None = None,
 ) -> list[CrawlResult]:
-    sites = collect_sites(config.directory_url, config)
-    results: list[CrawlResult] = []
-    for index, site in enumerate(sites, start=1):
-        try:
-            result = crawl_site(site, config)
-            results.append(result)
-            print(
-                f"[{index}/{len(sites)}] {site} -> {len(result.emails)} emails, "
-                f"{len(result.phones)} phones",
-            )
-        except requests.RequestException as exc:
-            results.append(
-                CrawlResult(
-                    site=site,
-                    error=str(exc),
-                ),
-            )
-            print(f"[{index}/{len(sites)}] {site} -> ERROR: {exc}")
-        if progress_callback:
-            progress_callback(index, len(sites), results[-1])
-        time.sleep(config.delay_s)
-    return results
+    return asyncio.run(crawl_all(config, progress_callback))
+
+
+CSV_FIELDNAMES = ("site", "emails", "phones", "contact_pages_checked", "error")
+
+
+def _csv_row(result: CrawlResult) -> tuple[str, ...]:
+    return (
+        result.site,
+        "; ".join(result.emails),
+        "; ".join(result.phones),
+        "; ".join(result.contact_pages_checked),
+        result.error or "",
+    )
 
 
 def write_csv(results: Iterable[CrawlResult], output_csv: str) -> None:
-    fieldnames = ["site", "emails", "phones", "contact_pages_checked", "error"]
     with open(output_csv, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for result in results:
-            row = asdict(result)
-            row["emails"] = "; ".join(result.emails)
-            row["phones"] = "; ".join(result.phones)
-            row["contact_pages_checked"] = "; ".join(result.contact_pages_checked)
-            writer.writerow(row)
+        writer = csv.writer(handle)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(map(_csv_row, results))
+
+
+@contextmanager
+def csv_stream(output_csv: str) -> Iterator[Callable[[CrawlResult], None]]:
+    with open(output_csv, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(CSV_FIELDNAMES)
+
+        def write_row(result: CrawlResult) -> None:
+            writer.writerow(_csv_row(result))
+            handle.flush()
+
+        yield write_row
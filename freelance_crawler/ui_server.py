@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import threading
 import time
@@ -10,10 +11,39 @@ from pathlib import Path
 from typing import Any
 
 from freelance_crawler.config import CrawlResult, CrawlerConfig
-from freelance_crawler.crawler import run_crawl
+from freelance_crawler.crawler import csv_stream, run_crawl
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
+_DEFAULTS = CrawlerConfig()
+_CONTENT_TYPES = {".html": "text/html", ".css": "text/css", ".js": "text/javascript"}
+
+
+def load_static(directory: Path) -> dict[str, tuple[bytes, str, str]]:
+    assets: dict[str, tuple[bytes, str, str]] = {}
+    for path in directory.rglob("*"):
+        if path.is_file():
+            data = path.read_bytes()
+            assets[path.relative_to(directory).as_posix()] = (
+                data,
+                _CONTENT_TYPES.get(path.suffix, "application/octet-stream"),
+                f'"{hashlib.md5(data).hexdigest()}"',
+            )
+    return assets
+
+
+_STATIC = load_static(STATIC_DIR)
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=asdict).encode("utf-8")
 
 
 @dataclass
@@ -32,10 +62,12 @@ class StatusTracker:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._status = CrawlStatus()
+        self._cached_json: bytes | None = None
 
     def start(self) -> None:
         with self._lock:
             self._status = CrawlStatus(running=True, started_at=time.time())
+            self._cached_json = None
 
     def update(self, completed: int, total: int, result: CrawlResult) -> None:
         with self._lock:
@@ -46,24 +78,32 @@ class StatusTracker:
                 self._status.results.append(result)
             else:
                 self._status.results[completed - 1] = result
+            self._cached_json = None
 
     def finish(self) -> None:
         with self._lock:
             self._status.running = False
             self._status.finished_at = time.time()
             self._status.current_site = None
+            self._cached_json = None
 
     def set_error(self, message: str) -> None:
         with self._lock:
             self._status.error = message
             self._status.running = False
             self._status.finished_at = time.time()
+            self._cached_json = None
 
-    def to_dict(self) -> dict[str, Any]:
+    @property
+    def running(self) -> bool:
         with self._lock:
-            data = asdict(self._status)
-            data["results"] = [asdict(result) for result in self._status.results]
-            return data
+            return self._status.running
+
+    def to_json_bytes(self) -> bytes:
+        with self._lock:
+            if self._cached_json is None:
+                self._cached_json = dumps(self._status)
+            return self._cached_json
 
 
 STATUS_TRACKER = StatusTracker()
@@ -71,12 +111,14 @@ STATUS_TRACKER = StatusTracker()
 
 def build_config(payload: dict[str, Any] | None) -> CrawlerConfig:
     if not payload:
-        return CrawlerConfig()
+        return _DEFAULTS
     return CrawlerConfig(
-        directory_url=payload.get("directory_url", CrawlerConfig().directory_url),
-        delay_s=float(payload.get("delay", CrawlerConfig().delay_s)),
-        timeout_s=int(payload.get("timeout", CrawlerConfig().timeout_s)),
-        output_csv=payload.get("output", CrawlerConfig().output_csv),
+        directory_url=payload.get("directory_url", _DEFAULTS.directory_url),
+        delay_s=float(payload.get("delay", _DEFAULTS.delay_s)),
+        timeout_s=int(payload.get("timeout", _DEFAULTS.timeout_s)),
+        max_workers=int(payload.get("workers", _DEFAULTS.max_workers)),
+        cache_dir=payload.get("cache_dir", _DEFAULTS.cache_dir),
+        output_csv=payload.get("output", _DEFAULTS.output_csv),
     )
 
 
@@ -86,11 +128,14 @@ def start_crawl(payload: dict[str, Any] | None) -> None:
 
     def run() -> None:
         try:
-            results = run_crawl(config, STATUS_TRACKER.update)
-            STATUS_TRACKER.finish()
-            from freelance_crawler.crawler import write_csv
+            with csv_stream(config.output_csv) as write_row:
+
+                def on_progress(completed: int, total: int, result: CrawlResult) -> None:
+                    STATUS_TRACKER.update(completed, total, result)
+                    write_row(result)
 
-            write_csv(results, config.output_csv)
+                run_crawl(config, on_progress)
+            STATUS_TRACKER.finish()
         except Exception as exc:  # pragma: no cover - best effort for UI
             STATUS_TRACKER.set_error(str(exc))
 
@@ -100,39 +145,44 @@ def start_crawl(payload: dict[str, Any] | None) -> None:
 
 class RequestHandler(BaseHTTPRequestHandler):
     def _send_json(self, payload: dict[str, Any], status: int = 200) -> None:
-        data = json.dumps(payload).encode("utf-8")
+        self._send_json_bytes(dumps(payload), status)
+
+    def _send_json_bytes(self, data: bytes, status: int = 200) -> None:
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(data)))
         self.end_headers()
         self.wfile.write(data)
 
-    def _send_file(self, path: Path) -> None:
-        if not path.exists():
+    def _send_file(self, name: str) -> None:
+        asset = _STATIC.get(name)
+        if asset is None:
             self.send_error(HTTPStatus.NOT_FOUND)
             return
-        data = path.read_bytes()
-        content_type = "text/html"
-        if path.suffix == ".css":
-            content_type = "text/css"
-        elif path.suffix == ".js":
-            content_type = "text/javascript"
+        data, content_type, etag = asset
+        if_none_match = self.headers.get("If-None-Match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
         self.send_response(HTTPStatus.OK)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "public, max-age=300")
         self.end_headers()
         self.wfile.write(data)
 
     def do_GET(self) -> None:  # noqa: N802
         if self.path == "/api/status":
-            self._send_json(STATUS_TRACKER.to_dict())
+            self._send_json_bytes(STATUS_TRACKER.to_json_bytes())
             return
         if self.path == "/":
-            self._send_file(STATIC_DIR / "index.html")
+            self._send_file("index.html")
             return
         if self.path.startswith("/static/"):
-            asset = self.path.replace("/static/", "")
-            self._send_file(STATIC_DIR / asset)
+            self._send_file(self.path[len("/static/"):])
             return
         self.send_error(HTTPStatus.NOT_FOUND)
 
@@ -144,7 +194,7 @@ class RequestHandler(BaseHTTPRequestHandler):
         payload = None
         if length:
             payload = json.loads(self.rfile.read(length) or b"{}")
-        if STATUS_TRACKER.to_dict().get("running"):
+        if STATUS_TRACKER.running:
             self._send_json({"error": "Crawler already running"}, status=409)
             return
         start_crawl(payload)
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+from multidict import CIMultiDict
+
+from freelance_crawler.config import CrawlerConfig
+from freelance_crawler.crawler import _cache_filter
+
+
+def _response(content_type="text/html", content_length=1000, **headers):
+    return SimpleNamespace(
+        content_type=content_type,
+        content_length=content_length,
+        headers=CIMultiDict({key.replace("_", "-"): value for key, value in headers.items()}),
+    )
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        (_response(), True),
+        (_response("application/xhtml+xml"), True),
+        (_response(Content_Encoding="identity"), True),
+        (_response("application/pdf"), False),
+        (_response(content_length=None), False),
+        (_response(content_length=2_000_001), False),
+        (_response(Content_Encoding="gzip"), False),
+        (_response(Content_Encoding="br"), False),
+    ],
+)
+def test_cache_filter(response, expected):
+    assert _cache_filter(CrawlerConfig())(response) is expected
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from freelance_crawler import cli, crawler
+from freelance_crawler.config import CrawlerConfig
+from freelance_crawler.crawler import crawl_all
+
+
+def test_crawl_all_rejects_zero_workers():
+    with pytest.raises(ValueError, match="max_workers"):
+        asyncio.run(crawl_all(CrawlerConfig(max_workers=0)))
+
+
+def test_cli_rejects_zero_workers():
+    with pytest.raises(SystemExit):
+        cli.build_parser().parse_args(["--workers", "0"])
+
+
+def test_crawl_site_finds_contact_links_in_noscript(monkeypatch):
+    pages = {
+        "https://ex.se/": '<html><body><noscript><a href="/kontakt">Kontakt</a>'
+        "</noscript></body></html>",
+        "https://ex.se/kontakt": "<html><body>info@ex.se</body></html>",
+    }
+
+    async def fake_fetch(session, url, config):
+        return pages[url]
+
+    monkeypatch.setattr(crawler, "fetch", fake_fetch)
+    result = asyncio.run(crawler.crawl_site(None, "https://ex.se/", CrawlerConfig()))
+    assert result.contact_pages_checked == ["https://ex.se/kontakt"]
+    assert result.emails == ["info@ex.se"]
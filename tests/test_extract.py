@@ -0,0 +1,48 @@
+import pytest
+
+from freelance_crawler import crawler
+
+SAMPLES = [
+    "Ring 08\xa0123\xa045\xa067",
+    "Ring ０８-１２３ ４５ ６７",
+    "Arabic-Indic ٠٨١٢٣٤٥٦٧",
+    "08\x1c123\x1c45\x1c67 and 08\v123\v45\v67",
+    "1" * 40,
+    "Tel +46 (0)8-123 45 67, fax 08.765.43.21; e-post kontakt@firma.se",
+    "Mail info@example.se or jane (at) example [dot] com",
+    "JOHN AT EXAMPLE DOT ORG, a@b.cc@d.ee, åsa@exämple.se",
+    "",
+]
+
+
+def _hyperscan_contacts(monkeypatch):
+    if crawler.hyperscan is None:
+        pytest.skip("hyperscan not installed")
+    monkeypatch.setattr(crawler, "Scanner", None)
+    monkeypatch.setattr(crawler, "_SCAN_DATABASE", crawler._build_scan_database())
+    monkeypatch.delattr(crawler._thread_local, "scratch", raising=False)
+    return crawler._scan_contacts
+
+
+def _native_contacts(monkeypatch):
+    if crawler.Scanner is None:
+        pytest.skip("native extension not built")
+    monkeypatch.delattr(crawler._thread_local, "scanner", raising=False)
+    return lambda text: crawler._native_scanner().extract(text.encode("utf-8"))
+
+
+@pytest.mark.parametrize("backend", [_hyperscan_contacts, _native_contacts])
+@pytest.mark.parametrize("text", SAMPLES)
+def test_backend_matches_regex(monkeypatch, backend, text):
+    extract = backend(monkeypatch)
+    assert extract(text) == crawler._regex_contacts(text)
+
+
+def test_long_digit_run_matches_findall():
+    assert crawler._regex_contacts("1" * 40)[1] == {"1" * 32, "1" * 8}
+
+
+def test_extract_contacts_normalizes_unicode():
+    emails, phones = crawler.extract_contacts(SAMPLES[0] + " " + SAMPLES[1])
+    assert emails == set()
+    assert phones == {"08 123 45 67", "08-123 45 67"}